@@ -4,12 +4,18 @@ import random
 
 from data import ApplianceSettings, ADSRParams
 from sim_time import SimulationTime
+from waveform import WaveformTable
 
 
 class DeviceState:
-    def __init__(self, base_wattage: float, adsr: ADSRParams, settings: ApplianceSettings | None = None):
+    def __init__(self, base_wattage: float, adsr: ADSRParams, settings: ApplianceSettings | None = None,
+                 *, wave_max_error: float = 1e-4, wave_interpolate: bool = False):
         self.base_wattage = base_wattage
         self.adsr = adsr
+        # Table lookup for periodic waves (nearest-sample is fastest), exact formula otherwise
+        self.wave_table = WaveformTable.for_adsr(
+            adsr, max_error=wave_max_error, interpolate=wave_interpolate)
+        self.wave_lookup = self.wave_table.lookup if self.wave_table else self.get_wave_multiplier
         self.settings = settings
         self.count = 0
         self.active_envelopes: list[tuple[float, bool]] = []
@@ -107,7 +113,7 @@ class DeviceState:
                         ((1.0 - self.adsr.s) * decay_progress)
                 else:
                     base_multiplier = self.adsr.s
-                    wave_multiplier = self.get_wave_multiplier(elapsed)
+                    wave_multiplier = self.wave_lookup(elapsed)
                     multiplier = base_multiplier * wave_multiplier
 
             # Apply both the ADSR envelope multiplier and the settings multiplier
@@ -4,7 +4,8 @@ import time
 import threading
 
 from data import DEVICES_CONFIG
-from sim_time import SimulationTime
+from sim_time import ClockDriver, SimulationTime
+from load_archive import LoadArchiveWriter
 
 from device_state import DeviceState
 from house_control import HouseControlWindow
@@ -13,26 +14,45 @@ from house_control import HouseControlWindow
 # Time acceleration factor (1 second real time = TIME_FACTOR seconds simulation time)
 TIME_FACTOR = 1.0
 
+# Max absolute error of the tabulated device waves against the exact formula,
+# and whether to interpolate between table samples (slower, but smaller tables)
+WAVE_MAX_ERROR = 1e-4
+WAVE_INTERPOLATE = False
+
+# Nominal period between loads updates (in sec)
+TICK_INTERVAL = 0.1
+
+# Max real time (in sec) recorded loads may stay buffered before being written
+ARCHIVE_FLUSH_INTERVAL = 10.0
+
 
 class HousesLoadSimulator:
-    def __init__(self, parent: tk.Tk, *, num_houses: int):
+    def __init__(self, parent: tk.Tk, *, num_houses: int, archive_path: str | None = None,
+                 driver: ClockDriver | None = None):
         """
         Parameters
         ----------
         - master : tkinter app root.
         - num_houses : number of houses in the simulation.
+        - archive_path : optional load archive file to record houses loads into.
+        - driver : optional simulation clock driver (defaults to wall clock).
         """
 
         self.parent = parent
         self.num_houses = num_houses
-        self.sim_time = SimulationTime(TIME_FACTOR)
+        self.sim_time = SimulationTime(TIME_FACTOR, driver)
         self.houses_windows: dict[int, HouseControlWindow] = {}
+        self.archive = LoadArchiveWriter(archive_path) if archive_path else None
+        self.archive_lock = threading.Lock()
+        self.archive_flushed_at = time.monotonic()
         self.houses_devices = [
             {
                 device_name: DeviceState(
                     base_wattage=config["wattage"],
                     adsr=config["adsr"],
-                    settings=config.get('settings', None))
+                    settings=config.get('settings', None),
+                    wave_max_error=WAVE_MAX_ERROR,
+                    wave_interpolate=WAVE_INTERPOLATE)
                 for device_name, config in DEVICES_CONFIG.items()
             }
             for _ in range(self.num_houses)
@@ -133,7 +153,11 @@ class HousesLoadSimulator:
         )
 
     def on_closing(self):
-        self.running = False
+        # Stop recording before closing the archive
+        with self.archive_lock:
+            self.running = False
+            if self.archive is not None:
+                self.archive.close()
 
         # Close all house control windows
         for window in self.houses_windows.values():
@@ -145,6 +169,8 @@ class HousesLoadSimulator:
 
     def update_loads_periodically(self):
         while self.running:
+            # One frozen timestamp shared by all houses and devices in this tick
+            elapsed_time = self.sim_time.tick()
             current_sim_time = self.sim_time.get_time()
             self.time_display.set(
                 f"Simulation Time: {current_sim_time.strftime('%H:%M:%S')}")
@@ -153,7 +179,6 @@ class HousesLoadSimulator:
             for house_index in range(self.num_houses):
                 total_house_load = 0
                 for device_state in self.houses_devices[house_index].values():
-                    elapsed_time = self.sim_time.get_elapsed()
                     device_state.active_envelopes = [
                         (start_time, active) for start_time, active in device_state.active_envelopes
                         if active or (elapsed_time - start_time <= device_state.adsr.r)
@@ -166,8 +191,30 @@ class HousesLoadSimulator:
 
                 self.houses_total_load[house_index].set(
                     f"Total Load: {int(total_house_load)} Watts")
+                self.record_load(house_index, elapsed_time, total_house_load)
                 total_system_load += total_house_load
 
             self.total_power.set(
                 f"Total Power: {total_system_load/1000:.2f} kW")
-            time.sleep(0.1)
+            self.flush_archive_periodically()
+            self.sim_time.driver.wait(TICK_INTERVAL)
+
+    def record_load(self, house_index: int, elapsed_time: float, load: float):
+        """Record a house load sample (timestamped in simulation milliseconds)"""
+        if self.archive is None:
+            return
+
+        with self.archive_lock:
+            if self.running:
+                self.archive.append(
+                    house_index, int(elapsed_time * 1000), load)
+
+    def flush_archive_periodically(self):
+        """Write buffered samples so a crash loses at most ARCHIVE_FLUSH_INTERVAL of data"""
+        if self.archive is None or time.monotonic() - self.archive_flushed_at < ARCHIVE_FLUSH_INTERVAL:
+            return
+
+        with self.archive_lock:
+            if self.running:
+                self.archive.flush()
+        self.archive_flushed_at = time.monotonic()
@@ -0,0 +1,389 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+import math
+import os
+import struct
+import sys
+from typing import BinaryIO
+
+
+MAGIC = b"HLSA\x01"
+
+# series, count, t_first, t_last, min, max, sum, payload length
+BLOCK_HEADER = struct.Struct("<IIqqdddI")
+
+# Timestamps are stored as signed 64-bit integers, series ids as unsigned 32-bit
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+UINT32_MAX = (1 << 32) - 1
+
+
+@dataclass
+class BlockInfo:
+    """
+    Attributes
+    ----------
+    - series : Series id (e.g. house index).
+    - count : Number of samples in the block.
+    - t_first : Timestamp of the first sample.
+    - t_last : Timestamp of the last sample.
+    - min : Minimum value in the block.
+    - max : Maximum value in the block.
+    - sum : Sum of the values in the block.
+    - offset : File offset of the compressed payload.
+    - length : Length of the compressed payload (in bytes).
+    """
+    series: int
+    count: int
+    t_first: int
+    t_last: int
+    min: float
+    max: float
+    sum: float
+    offset: int
+    length: int
+
+
+class _BitWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self.acc = 0
+        self.nbits = 0
+
+    def write(self, value: int, nbits: int):
+        self.acc = (self.acc << nbits) | (value & ((1 << nbits) - 1))
+        self.nbits += nbits
+        while self.nbits >= 8:
+            self.nbits -= 8
+            self.data.append((self.acc >> self.nbits) & 0xFF)
+        self.acc &= (1 << self.nbits) - 1
+
+    def getvalue(self) -> bytes:
+        if self.nbits:
+            return bytes(self.data) + bytes([(self.acc << (8 - self.nbits)) & 0xFF])
+        return bytes(self.data)
+
+
+class _BitReader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.acc = 0
+        self.nbits = 0
+
+    def read(self, nbits: int) -> int:
+        while self.nbits < nbits:
+            self.acc = (self.acc << 8) | self.data[self.pos]
+            self.pos += 1
+            self.nbits += 8
+        self.nbits -= nbits
+        value = self.acc >> self.nbits
+        self.acc &= (1 << self.nbits) - 1
+        return value
+
+    def read_signed(self, nbits: int) -> int:
+        value = self.read(nbits)
+        if value >= 1 << (nbits - 1):
+            value -= 1 << nbits
+        return value
+
+
+# Delta-of-delta buckets: (control bits, control length, value bits)
+_DOD_BUCKETS = [
+    (0b10, 2, 7),
+    (0b110, 3, 9),
+    (0b1110, 4, 12),
+    (0b1111, 4, 64),
+]
+
+
+def _float_bits(value: float) -> int:
+    return struct.unpack("<Q", struct.pack("<d", value))[0]
+
+
+def _bits_float(bits: int) -> float:
+    return struct.unpack("<d", struct.pack("<Q", bits))[0]
+
+
+def _encode_block(timestamps: list[int], values: list[float]) -> bytes:
+    """
+    Encode a block with delta-of-delta timestamps and XOR (Gorilla) floats.
+    The first timestamp is kept in the block header.
+    """
+    writer = _BitWriter()
+
+    prev_bits = _float_bits(values[0])
+    writer.write(prev_bits, 64)
+    prev_leading, prev_trailing = -1, -1
+    prev_time, prev_delta = timestamps[0], 0
+
+    for timestamp, value in zip(timestamps[1:], values[1:]):
+        # Timestamp
+        delta = timestamp - prev_time
+        dod = delta - prev_delta
+        if dod == 0:
+            writer.write(0, 1)
+        else:
+            for control, control_len, nbits in _DOD_BUCKETS:
+                if -(1 << (nbits - 1)) <= dod < (1 << (nbits - 1)):
+                    writer.write(control, control_len)
+                    writer.write(dod, nbits)
+                    break
+            else:
+                raise ValueError(f"Delta-of-delta {dod} does not fit in 64 bits!")
+        prev_time, prev_delta = timestamp, delta
+
+        # Value
+        bits = _float_bits(value)
+        xor = bits ^ prev_bits
+        prev_bits = bits
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+
+        leading = min(64 - xor.bit_length(), 31)
+        trailing = (xor & -xor).bit_length() - 1
+        if prev_leading >= 0 and leading >= prev_leading and trailing >= prev_trailing:
+            # Reuse the previous meaningful-bits window
+            writer.write(0b10, 2)
+            writer.write(xor >> prev_trailing, 64 - prev_leading - prev_trailing)
+        else:
+            meaningful = 64 - leading - trailing
+            writer.write(0b11, 2)
+            writer.write(leading, 5)
+            writer.write(meaningful - 1, 6)
+            writer.write(xor >> trailing, meaningful)
+            prev_leading, prev_trailing = leading, trailing
+
+    return writer.getvalue()
+
+
+def _decode_block(payload: bytes, count: int, t_first: int) -> tuple[list[int], list[float]]:
+    """
+    Decode a block written by `_encode_block`.
+    """
+    reader = _BitReader(payload)
+
+    prev_bits = reader.read(64)
+    timestamps = [t_first]
+    values = [_bits_float(prev_bits)]
+    prev_leading, prev_trailing = 0, 0
+    prev_time, prev_delta = t_first, 0
+
+    for _ in range(count - 1):
+        # Timestamp
+        dod = 0
+        if reader.read(1):
+            # Each further '1' control bit selects the next (wider) bucket
+            for _, _, nbits in _DOD_BUCKETS[:-1]:
+                if not reader.read(1):
+                    break
+            else:
+                nbits = _DOD_BUCKETS[-1][2]
+            dod = reader.read_signed(nbits)
+        prev_delta += dod
+        prev_time += prev_delta
+        timestamps.append(prev_time)
+
+        # Value
+        if reader.read(1):
+            if reader.read(1):
+                prev_leading = reader.read(5)
+                meaningful = reader.read(6) + 1
+                prev_trailing = 64 - prev_leading - meaningful
+            xor = reader.read(64 - prev_leading - prev_trailing) << prev_trailing
+            prev_bits ^= xor
+        values.append(_bits_float(prev_bits))
+
+    return timestamps, values
+
+
+class LoadArchiveWriter:
+    def __init__(self, path: str, *, block_size: int = 1024):
+        """
+        Parameters
+        ----------
+        - path : Archive file path (overwritten if it exists).
+        - block_size : Number of samples per block and series.
+        """
+        if block_size < 1:
+            raise ValueError("`block_size` must be positive!")
+
+        self.block_size = block_size
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(MAGIC)
+        self.buffers: dict[int, tuple[list[int], list[float]]] = {}
+        self.last_timestamps: dict[int, int] = {}
+
+    def append(self, series: int, timestamp: int, value: float):
+        """
+        Append a sample to a series. Timestamps are integers (e.g. milliseconds)
+        and must not decrease within a series.
+        """
+        if self.file.closed:
+            raise ValueError("Archive is closed!")
+
+        # Validate everything the block header and encoding need up front,
+        # so a bad sample is rejected instead of losing the buffered block.
+        if not 0 <= series <= UINT32_MAX:
+            raise ValueError("Series ids must fit in an unsigned 32-bit integer!")
+        if not INT64_MIN <= timestamp <= INT64_MAX:
+            raise ValueError("Timestamps must fit in a signed 64-bit integer!")
+        if timestamp < self.last_timestamps.get(series, timestamp):
+            raise ValueError("Timestamps must not decrease within a series!")
+
+        timestamps, values = self.buffers.setdefault(series, ([], []))
+        if timestamps:
+            prev_delta = timestamps[-1] - timestamps[-2] if len(timestamps) > 1 else 0
+            if not INT64_MIN <= timestamp - timestamps[-1] - prev_delta <= INT64_MAX:
+                raise ValueError("Timestamp jump does not fit in a 64-bit delta-of-delta!")
+
+        self.last_timestamps[series] = timestamp
+        timestamps.append(timestamp)
+        values.append(float(value))
+        if len(timestamps) >= self.block_size:
+            self._write_block(series)
+
+    def _write_block(self, series: int):
+        timestamps, values = self.buffers.pop(series)
+        payload = _encode_block(timestamps, values)
+        self.file.write(BLOCK_HEADER.pack(
+            series, len(values), timestamps[0], timestamps[-1],
+            min(values), max(values), math.fsum(values), len(payload)))
+        self.file.write(payload)
+
+    def flush(self):
+        """
+        Write all pending samples as (possibly short) blocks.
+        """
+        for series in list(self.buffers):
+            self._write_block(series)
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self) -> "LoadArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LoadArchiveReader:
+    def __init__(self, path: str):
+        """
+        Parameters
+        ----------
+        - path : Archive file path.
+        """
+        self.file: BinaryIO = open(path, "rb")
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path!r} is not a load archive!")
+
+        # Scan block headers only; payloads are decoded on demand.
+        # Blocks of a series are written in time order, so both
+        # `t_first` and `t_last` are sorted and can be bisected.
+        self.blocks: dict[int, list[BlockInfo]] = {}
+        self.t_firsts: dict[int, list[int]] = {}
+        self.t_lasts: dict[int, list[int]] = {}
+        file_size = os.fstat(self.file.fileno()).st_size
+        while header := self.file.read(BLOCK_HEADER.size):
+            if len(header) < BLOCK_HEADER.size:
+                break
+            series, count, t_first, t_last, vmin, vmax, vsum, length = BLOCK_HEADER.unpack(header)
+            offset = self.file.tell()
+            if offset + length > file_size:
+                # Trailing block cut short (e.g. the writer was killed)
+                break
+            self.blocks.setdefault(series, []).append(BlockInfo(
+                series, count, t_first, t_last, vmin, vmax, vsum, offset, length))
+            self.t_firsts.setdefault(series, []).append(t_first)
+            self.t_lasts.setdefault(series, []).append(t_last)
+            self.file.seek(length, 1)
+
+    def series(self) -> list[int]:
+        """
+        Return the ids of all series in the archive.
+        """
+        return sorted(self.blocks)
+
+    def _blocks_in_range(self, series: int, start: int | None, end: int | None) -> list[BlockInfo]:
+        if series not in self.blocks:
+            return []
+
+        blocks = self.blocks[series]
+        low = 0 if start is None else bisect_left(self.t_lasts[series], start)
+        high = len(blocks) if end is None else bisect_right(self.t_firsts[series], end)
+        return blocks[low:high]
+
+    def _decode(self, block: BlockInfo) -> tuple[list[int], list[float]]:
+        self.file.seek(block.offset)
+        return _decode_block(self.file.read(block.length), block.count, block.t_first)
+
+    def read(self, series: int, start: int | None = None, end: int | None = None) -> list[tuple[int, float]]:
+        """
+        Return the (timestamp, value) samples of a series within [start, end].
+        """
+        samples = []
+        for block in self._blocks_in_range(series, start, end):
+            for timestamp, value in zip(*self._decode(block)):
+                if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                    samples.append((timestamp, value))
+        return samples
+
+    def aggregate(self, series: int, start: int | None = None, end: int | None = None) -> dict[str, int | float]:
+        """
+        Return count, min, max, sum and mean of a series within [start, end].
+        Blocks fully inside the range are answered from their index only.
+        """
+        count, vmin, vmax, parts = 0, math.inf, -math.inf, []
+        for block in self._blocks_in_range(series, start, end):
+            if (start is None or block.t_first >= start) and (end is None or block.t_last <= end):
+                count += block.count
+                vmin = min(vmin, block.min)
+                vmax = max(vmax, block.max)
+                parts.append(block.sum)
+                continue
+
+            for timestamp, value in zip(*self._decode(block)):
+                if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                    count += 1
+                    vmin = min(vmin, value)
+                    vmax = max(vmax, value)
+                    parts.append(value)
+
+        total = math.fsum(parts)
+        return {
+            "count": count,
+            "min": vmin if count else math.nan,
+            "max": vmax if count else math.nan,
+            "sum": total,
+            "mean": total / count if count else math.nan,
+        }
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "LoadArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == "__main__":
+    # Usage: python load_archive.py <archive> [start end]
+    args = sys.argv[1:]
+    if len(args) not in (1, 3):
+        sys.exit("Usage: python load_archive.py <archive> [start end]")
+
+    start, end = (int(args[1]), int(args[2])) if len(args) == 3 else (None, None)
+    with LoadArchiveReader(args[0]) as archive:
+        for series in archive.series():
+            stats = archive.aggregate(series, start, end)
+            print(f"Series {series}: {stats['count']} samples, "
+                  f"min {stats['min']:.1f}, max {stats['max']:.1f}, mean {stats['mean']:.1f}")
@@ -1,9 +1,17 @@
+import argparse
 import tkinter as tk
 
 from houses_load_sim import HousesLoadSimulator
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Houses Load Simulator")
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        help="record houses loads into a load archive file")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    HousesLoadSimulator(root, num_houses=9)
+    HousesLoadSimulator(root, num_houses=9, archive_path=args.archive)
     root.mainloop()
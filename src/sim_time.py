@@ -1,44 +1,213 @@
+from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timedelta
+import threading
 import time
 
 
+class ClockDriver(ABC):
+    """
+    Source of driver time (in nanoseconds) for `SimulationTime`.
+    """
+
+    @abstractmethod
+    def now_ns(self) -> int:
+        """
+        Return the current driver time (in nanosec).
+        """
+
+    def tick(self):
+        """
+        Called once at the start of every simulation tick.
+        """
+
+    def wait(self, interval: float):
+        """
+        Block until the next tick is due (`interval` is the nominal tick period in sec).
+        Virtual drivers do not wait, so headless runs go as fast as possible.
+        """
+
+
+class WallClockDriver(ClockDriver):
+    """
+    Real time, immune to wall clock adjustments (NTP, DST, ...).
+    """
+
+    def now_ns(self) -> int:
+        return time.monotonic_ns()
+
+    def wait(self, interval: float):
+        time.sleep(interval)
+
+
+class SteppedClockDriver(ClockDriver):
+    def __init__(self, step: float):
+        """
+        Virtual time advancing by a fixed step on every tick (for headless runs).
+
+        Parameters
+        ----------
+        - step : Driver time added per tick (in sec).
+        """
+        if step <= 0:
+            raise ValueError("`step` must be positive!")
+        self.step_ns = int(step * 1e9)
+        self.current_ns = 0
+
+    def now_ns(self) -> int:
+        return self.current_ns
+
+    def tick(self):
+        self.current_ns += self.step_ns
+
+
+class ExternalClockDriver(ClockDriver):
+    """
+    Time set by an external master (for lockstep co-simulation).
+
+    Every `advance`/`set` call queues one step; each step is applied by exactly
+    one tick, and the call blocks until that tick has finished computing.
+    """
+
+    def __init__(self):
+        self.current_ns = 0
+        self.condition = threading.Condition()
+        self.steps: deque[int] = deque()
+        self.queued_ns = 0
+        self.requested = 0
+        self.completed = 0
+        self.stepping = False
+
+    def now_ns(self) -> int:
+        return self.current_ns
+
+    def _queue_step(self, target_ns: int, block: bool):
+        with self.condition:
+            if target_ns < self.queued_ns:
+                raise ValueError("External clock can not go backwards!")
+            self.steps.append(target_ns)
+            self.queued_ns = target_ns
+            self.requested += 1
+            step = self.requested
+            self.condition.notify_all()
+
+            if block:
+                self.condition.wait_for(lambda: self.completed >= step)
+
+    def advance(self, seconds: float, *, block: bool = True):
+        """
+        Advance the driver time by `seconds` (one tick).
+        Unless `block` is False, wait until that tick has finished.
+        """
+        if seconds < 0:
+            raise ValueError("External clock can not go backwards!")
+        with self.condition:
+            self._queue_step(self.queued_ns + int(seconds * 1e9), block)
+
+    def set(self, seconds: float, *, block: bool = True):
+        """
+        Set the driver time to `seconds` (one tick, must not go backwards).
+        Unless `block` is False, wait until that tick has finished.
+        """
+        self._queue_step(int(seconds * 1e9), block)
+
+    def tick(self):
+        # Apply the next queued step, if any
+        with self.condition:
+            if self.steps:
+                self.current_ns = self.steps.popleft()
+                self.stepping = True
+
+    def wait(self, interval: float):
+        with self.condition:
+            # The step applied by this tick is done
+            if self.stepping:
+                self.stepping = False
+                self.completed += 1
+                self.condition.notify_all()
+
+            # Lockstep: the next tick happens once the master queued a step
+            self.condition.wait_for(lambda: self.steps)
+
+
 class SimulationTime:
-    def __init__(self, time_factor: float):
+    def __init__(self, time_factor: float, driver: ClockDriver | None = None):
         """
         Parameters
         ----------
         - timeFactor : Time acceleration factor (in sec).
+        - driver : Source of time (defaults to `WallClockDriver`).
         """
         self.time_factor = time_factor
-        self.start_real_time = time.time()
-        self.paused_at = None
-        self.pause_duration = 0
+        self.driver = driver or WallClockDriver()
+        self.start_datetime = datetime.now()
+        self.lock = threading.Lock()
 
-    def get_elapsed(self) -> float:
+        # Simulation time is linear in driver time since the last anchor,
+        # so re-anchoring keeps it continuous across pauses and factor changes.
+        self.anchor_driver_ns = self.driver.now_ns()
+        self.anchor_sim_ns = 0
+        self.paused = False
+
+        # Frozen timestamp shared by everything within a tick
+        self.tick_sim_ns = 0
+
+    def _sim_ns_at(self, driver_ns: int) -> int:
+        if self.paused:
+            return self.anchor_sim_ns
+        return self.anchor_sim_ns + int((driver_ns - self.anchor_driver_ns) * self.time_factor)
+
+    def _reanchor(self):
+        driver_ns = self.driver.now_ns()
+        self.anchor_sim_ns = self._sim_ns_at(driver_ns)
+        self.anchor_driver_ns = driver_ns
+
+    def tick(self) -> float:
         """
+        Sample the driver once and freeze the simulation time for this tick.
         Return the elapsed simulation time (number of seconds).
         """
-        if self.paused_at is not None:
-            return (self.paused_at - self.start_real_time - self.pause_duration) * self.time_factor
-        return (time.time() - self.start_real_time - self.pause_duration) * self.time_factor
+        with self.lock:
+            self.driver.tick()
+            # Never go backwards, even if the driver does
+            self.tick_sim_ns = max(
+                self.tick_sim_ns, self._sim_ns_at(self.driver.now_ns()))
+        return self.get_elapsed()
+
+    def get_elapsed(self) -> float:
+        """
+        Return the elapsed simulation time (number of seconds) of the current tick.
+        """
+        return self.tick_sim_ns / 1e9
 
     def get_time(self) -> datetime:
         """
-        Return the current simulation datetime.
+        Return the simulation datetime of the current tick.
+        """
+        return self.start_datetime + timedelta(microseconds=self.tick_sim_ns // 1000)
+
+    def set_time_factor(self, time_factor: float):
+        """
+        Change the time acceleration factor without a time discontinuity.
         """
-        return datetime.now() + timedelta(seconds=self.get_elapsed())
+        with self.lock:
+            self._reanchor()
+            self.time_factor = time_factor
 
     def pause(self):
         """
         Pause the simulation time.
         """
-        if self.paused_at is None:
-            self.paused_at = time.time()
+        with self.lock:
+            if not self.paused:
+                self._reanchor()
+                self.paused = True
 
     def resume(self):
         """
         Resume the simulation time.
         """
-        if self.paused_at is not None:
-            self.pause_duration += time.time() - self.paused_at
-            self.paused_at = None
+        with self.lock:
+            if self.paused:
+                self.anchor_driver_ns = self.driver.now_ns()
+                self.paused = False
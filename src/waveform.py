@@ -0,0 +1,140 @@
+import math
+
+from data import ADSRParams
+
+
+class WaveformTable:
+    # Shared tables, keyed by (wt, wp, wa, max_error, interpolate).
+    _cache: dict[tuple, "WaveformTable"] = {}
+
+    def __init__(self, adsr: ADSRParams, *, max_error: float = 1e-4, interpolate: bool = True):
+        """
+        Precomputed one-period table of the adsr wave multiplier.
+
+        Parameters
+        ----------
+        - adsr : ADSR parameters (only `wt`, `wp` and `wa` are used).
+        - max_error : Upper bound of the absolute error against the exact formula.
+        - interpolate : Linearly interpolate between samples (needs far fewer samples).
+        """
+        if max_error <= 0:
+            raise ValueError("`max_error` must be positive!")
+        if adsr.wt not in ("none", "sine", "square"):
+            raise ValueError(f"`adsr.wt` = {adsr.wt!r} is not periodic!")
+
+        self.wt = adsr.wt
+        self.wp = adsr.wp
+        self.wa = adsr.wa
+        self.max_error = max_error
+        self.interpolate = interpolate
+        self.size = self._table_size()
+        self.table = self._build_table()
+        self.scale = self.size / self.wp if self.size > 1 else 0.0
+        self.lookup, self.lookup_many = self._make_lookups()
+
+    @classmethod
+    def for_adsr(cls, adsr: ADSRParams, *, max_error: float = 1e-4,
+                 interpolate: bool = True) -> "WaveformTable | None":
+        """
+        Return the shared table for `adsr`, or None if its wave is not periodic.
+        """
+        if adsr.wt not in ("none", "sine", "square"):
+            return None
+
+        key = (adsr.wt, adsr.wp, adsr.wa, max_error, interpolate)
+        if key not in cls._cache:
+            cls._cache[key] = cls(
+                adsr, max_error=max_error, interpolate=interpolate)
+        return cls._cache[key]
+
+    def _table_size(self) -> int:
+        match self.wt:
+            case "none":
+                return 1
+            case "square":
+                # An even size puts the edge exactly on a sample boundary,
+                # so the (non-interpolated) lookup is exact.
+                return 2
+            case "sine":
+                if self.interpolate:
+                    # Linear interpolation error: wa * (2pi/n)^2 / 8
+                    n = math.pi * math.sqrt(abs(self.wa) / (2 * self.max_error))
+                else:
+                    # Nearest sample error: wa * (2pi/n) / 2
+                    n = math.pi * abs(self.wa) / self.max_error
+                return max(4, math.ceil(n))
+
+    def _build_table(self) -> list[float]:
+        match self.wt:
+            case "none":
+                return [1.0]
+            case "square":
+                return [1.0 + self.wa, 1.0 - self.wa]
+            case "sine":
+                return [
+                    1.0 + self.wa * math.sin(2 * math.pi * i / self.size)
+                    for i in range(self.size)
+                ]
+
+    def _make_lookups(self):
+        """
+        Pick the specialized (scalar, batch) lookup functions for this wave once,
+        so a lookup is only a multiply, an int conversion and an index.
+        """
+        table = self.table
+        size = self.size
+        scale = self.scale
+
+        if self.wt == "none":
+            value = table[0]
+
+            def lookup(elapsed: float) -> float:
+                return value
+
+            def lookup_many(elapsed: list[float]) -> list[float]:
+                return [value] * len(elapsed)
+
+        elif self.wt == "square":
+            # scale = 2 / wp, so the parity of the half-period index is the level
+            def lookup(elapsed: float) -> float:
+                return table[int(elapsed * scale) & 1]
+
+            def lookup_many(elapsed: list[float]) -> list[float]:
+                return [table[int(t * scale) & 1] for t in elapsed]
+
+        elif not self.interpolate:
+            def lookup(elapsed: float) -> float:
+                return table[int(elapsed * scale + 0.5) % size]
+
+            def lookup_many(elapsed: list[float]) -> list[float]:
+                return [table[int(t * scale + 0.5) % size] for t in elapsed]
+
+        else:
+            # Per-sample slope towards the next sample (wrapping around)
+            slopes = [table[(i + 1) % size] - table[i] for i in range(size)]
+
+            def lookup(elapsed: float) -> float:
+                position = elapsed * scale
+                idx = int(position)
+                frac = position - idx
+                idx %= size
+                return table[idx] + slopes[idx] * frac
+
+            def lookup_many(elapsed: list[float]) -> list[float]:
+                values = []
+                append = values.append
+                for t in elapsed:
+                    position = t * scale
+                    idx = int(position)
+                    frac = position - idx
+                    idx %= size
+                    append(table[idx] + slopes[idx] * frac)
+                return values
+
+        return lookup, lookup_many
+
+    def __call__(self, elapsed: float) -> float:
+        """
+        Return the wave multiplier at `elapsed` simulation seconds.
+        """
+        return self.lookup(elapsed)
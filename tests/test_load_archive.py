@@ -0,0 +1,120 @@
+import math
+import random
+
+import pytest
+
+from load_archive import LoadArchiveReader, LoadArchiveWriter, _decode_block, _encode_block
+
+
+def make_series(seed: int, count: int) -> list[tuple[int, float]]:
+    rng = random.Random(seed)
+    samples, timestamp = [], 0
+    for i in range(count):
+        # Mostly regular minute steps, with jitter and a huge jump (64-bit delta-of-delta)
+        timestamp += rng.choice([60000, 60000, 60000, 60001, 59990, 0]) + (2**40 if i == count // 2 else 0)
+        value = rng.choice([
+            0.0, -0.0, 1234.5, 5e-324, 2.2250738585072014e-308, -1e300,
+            rng.uniform(0, 5000), float(rng.randint(0, 5000)),
+        ])
+        samples.append((timestamp, value))
+    return samples
+
+
+def same_floats(a: list[float], b: list[float]) -> bool:
+    # Compare bit patterns so -0.0 and 0.0 are told apart
+    return [math.copysign(1, x) for x in a] == [math.copysign(1, x) for x in b] and a == b
+
+
+def test_block_round_trip():
+    samples = make_series(0, 3000)
+    timestamps = [t for t, _ in samples]
+    values = [v for _, v in samples]
+
+    decoded_timestamps, decoded_values = _decode_block(
+        _encode_block(timestamps, values), len(samples), timestamps[0])
+
+    assert decoded_timestamps == timestamps
+    assert same_floats(decoded_values, values)
+
+
+def test_archive_read_and_aggregate(tmp_path):
+    path = str(tmp_path / "loads.hlsa")
+    series = {s: make_series(s, 2345) for s in range(3)}
+    with LoadArchiveWriter(path, block_size=100) as writer:
+        for i in range(2345):
+            for s, samples in series.items():
+                writer.append(s, *samples[i])
+
+    with LoadArchiveReader(path) as reader:
+        assert reader.series() == [0, 1, 2]
+        for s, samples in series.items():
+            read = reader.read(s)
+            assert [t for t, _ in read] == [t for t, _ in samples]
+            assert same_floats([v for _, v in read], [v for _, v in samples])
+
+            # Range boundaries fall inside blocks, so both index and decode paths are used
+            start, end = samples[150][0] + 1, samples[1870][0] - 1
+            expected = [v for t, v in samples if start <= t <= end]
+            assert reader.read(s, start, end) == [(t, v) for t, v in samples if start <= t <= end]
+
+            stats = reader.aggregate(s, start, end)
+            assert stats["count"] == len(expected)
+            assert stats["min"] == min(expected)
+            assert stats["max"] == max(expected)
+            assert stats["sum"] == pytest.approx(math.fsum(expected), rel=1e-12, abs=1e-300)
+
+        empty = reader.aggregate(0, -10, -1)
+        assert empty["count"] == 0 and math.isnan(empty["mean"])
+
+
+def test_truncated_trailing_block_is_dropped(tmp_path):
+    path = str(tmp_path / "loads.hlsa")
+    samples = make_series(1, 250)
+    with LoadArchiveWriter(path, block_size=100) as writer:
+        for sample in samples:
+            writer.append(0, *sample)
+
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 3)
+
+    with LoadArchiveReader(path) as reader:
+        assert reader.read(0) == samples[:200]
+
+
+def test_timestamps_must_not_decrease_across_blocks(tmp_path):
+    with LoadArchiveWriter(str(tmp_path / "loads.hlsa"), block_size=2) as writer:
+        writer.append(0, 10, 1.0)
+        writer.append(0, 20, 1.0)
+        with pytest.raises(ValueError):
+            writer.append(0, 15, 1.0)
+
+
+def test_missing_series_is_empty(tmp_path):
+    path = str(tmp_path / "loads.hlsa")
+    with LoadArchiveWriter(path) as writer:
+        writer.append(0, 0, 1.0)
+
+    with LoadArchiveReader(path) as reader:
+        assert reader.read(5) == []
+        assert reader.read(5, 0, 10) == []
+        assert reader.aggregate(5, 0, 10)["count"] == 0
+
+
+def test_out_of_range_timestamps_are_rejected(tmp_path):
+    path = str(tmp_path / "loads.hlsa")
+    with LoadArchiveWriter(path) as writer:
+        for timestamp in (2**63, -2**63 - 1):
+            with pytest.raises(ValueError):
+                writer.append(0, timestamp, 1.0)
+
+        # Fits in int64, but the jump does not fit in a 64-bit delta-of-delta
+        writer.append(0, -2**63, 1.0)
+        with pytest.raises(ValueError):
+            writer.append(0, 0, 1.0)
+        writer.append(0, -2**63 + 10, 2.0)
+
+    with LoadArchiveReader(path) as reader:
+        assert reader.read(0) == [(-2**63, 1.0), (-2**63 + 10, 2.0)]
+
+    with pytest.raises(ValueError):
+        _encode_block([-2**63, 0, 0], [1.0, 1.0, 1.0])
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from sim_time import ClockDriver, ExternalClockDriver, SimulationTime, SteppedClockDriver
+
+
+def test_clock_driver_is_abstract():
+    with pytest.raises(TypeError):
+        ClockDriver()
+
+
+def test_stepped_driver_rejects_non_positive_step():
+    for step in (0, -1):
+        with pytest.raises(ValueError):
+            SteppedClockDriver(step)
+
+
+def test_stepped_driver_advances_once_per_tick():
+    sim_time = SimulationTime(60, SteppedClockDriver(0.1))
+    assert [sim_time.tick() for _ in range(3)] == [6.0, 12.0, 18.0]
+    # Frozen within a tick
+    assert sim_time.get_elapsed() == 18.0
+
+
+def test_pause_and_time_factor_are_continuous():
+    driver = ExternalClockDriver()
+    sim_time = SimulationTime(2.0, driver)
+
+    # Single threaded: queue each step, then tick to apply it
+    driver.advance(1, block=False)
+    assert sim_time.tick() == 2.0
+
+    sim_time.set_time_factor(10)
+    driver.advance(1, block=False)
+    assert sim_time.tick() == 12.0
+
+    sim_time.pause()
+    driver.advance(5, block=False)
+    assert sim_time.tick() == 12.0
+
+    sim_time.resume()
+    driver.advance(1, block=False)
+    assert sim_time.tick() == 22.0
+
+
+def run_loop(sim_time: SimulationTime, ticks: list[float], count: int):
+    # Same shape as the simulator update loop: tick, compute, wait
+    for _ in range(count):
+        ticks.append(sim_time.tick())
+        sim_time.driver.wait(0.1)
+
+
+def test_external_driver_lockstep():
+    driver = ExternalClockDriver()
+    sim_time = SimulationTime(1.0, driver)
+    ticks: list[float] = []
+    thread = threading.Thread(target=run_loop, args=(sim_time, ticks, 3), daemon=True)
+    thread.start()
+
+    # Each call returns once its tick has been computed
+    driver.advance(1)
+    assert ticks[-1] == 1.0
+    driver.set(3)
+    assert ticks[-1] == 3.0
+
+    with pytest.raises(ValueError):
+        driver.set(2)
+
+
+def test_external_driver_does_not_merge_steps():
+    driver = ExternalClockDriver()
+    sim_time = SimulationTime(1.0, driver)
+
+    # Two steps queued before the loop reaches wait() still give two ticks
+    driver.advance(1, block=False)
+    driver.advance(1, block=False)
+
+    ticks: list[float] = []
+    thread = threading.Thread(target=run_loop, args=(sim_time, ticks, 3), daemon=True)
+    thread.start()
+    driver.advance(1)
+
+    assert ticks == [1.0, 2.0, 3.0]
@@ -0,0 +1,52 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from data import ADSRParams, DEVICES_CONFIG
+from waveform import WaveformTable
+
+DeviceState = pytest.importorskip("device_state").DeviceState
+
+PERIODIC_DEVICES = [
+    name for name, config in DEVICES_CONFIG.items()
+    if config["adsr"].wt in ("sine", "square")
+]
+
+
+def exact_multiplier(adsr: ADSRParams, elapsed: float) -> float:
+    # Reference formula, without building the (tkinter backed) device state
+    return DeviceState.get_wave_multiplier(SimpleNamespace(adsr=adsr), elapsed)
+
+
+@pytest.mark.parametrize("interpolate", [True, False])
+@pytest.mark.parametrize("max_error", [1e-3, 1e-5])
+@pytest.mark.parametrize("device_name", PERIODIC_DEVICES)
+def test_table_error_is_bounded(device_name, max_error, interpolate):
+    adsr = DEVICES_CONFIG[device_name]["adsr"]
+    table = WaveformTable(adsr, max_error=max_error, interpolate=interpolate)
+
+    rng = random.Random(0)
+    # Up to one simulated year
+    for elapsed in (rng.uniform(0, 3e7) for _ in range(5000)):
+        assert abs(table(elapsed) - exact_multiplier(adsr, elapsed)) <= max_error
+
+
+@pytest.mark.parametrize("interpolate", [True, False])
+@pytest.mark.parametrize("device_name", PERIODIC_DEVICES)
+def test_lookup_many_matches_lookup(device_name, interpolate):
+    table = WaveformTable(DEVICES_CONFIG[device_name]["adsr"], interpolate=interpolate)
+
+    rng = random.Random(1)
+    elapsed = [rng.uniform(0, 1e5) for _ in range(1000)]
+    assert table.lookup_many(elapsed) == [table.lookup(t) for t in elapsed]
+
+
+def test_non_periodic_and_invalid_parameters():
+    adsr = ADSRParams(a=1.0, d=1.0, s=1.0, r=1.0, wt="random", wp=1, wa=0.1)
+    assert WaveformTable.for_adsr(adsr) is None
+
+    sine = ADSRParams(a=1.0, d=1.0, s=1.0, r=1.0, wt="sine", wp=1, wa=0.1)
+    for max_error in (0, -1e-4):
+        with pytest.raises(ValueError):
+            WaveformTable(sine, max_error=max_error)